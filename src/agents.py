@@ -1,12 +1,12 @@
 """ Create agents based on configuration using Agent from crewai """
 
-import yaml
 import os
 from pathlib import Path
 from typing import List
 
 from crewai import Agent
 from src.tools import PythonREPLTool
+from src.prompts import compile_config
 from langchain_openai import ChatOpenAI
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -30,15 +30,13 @@ class Agents:
         self.result_path = root_path + "/results/" + Path(dataset_cleanname).stem.split('.')[0]
         os.makedirs(os.path.join(self.result_path, "images"), exist_ok=True)
         
+        # Compiled once per dataset and shared by every flow on it
         try:
-            with open(config_path, 'r', encoding='utf-8') as file:
-                content = file.read()
-            self.config = yaml.safe_load(
-                content.replace("{result_path}", str(self.result_path)) \
-                    .replace("{dataset_name}", str(self.dataset_cleanname))
-                    )
+            self.config = compile_config(config_path,
+                                         result_path=self.result_path,
+                                         dataset_name=self.dataset_cleanname)
         except FileNotFoundError as e:
-            raise FileNotFoundError(f"Agent configuration file not found: {self.config_path}") from e
+            raise FileNotFoundError(f"Agent configuration file not found: {config_path}") from e
         
         self.model = ChatOpenAI(
             api_key = api_key,
@@ -56,7 +54,7 @@ class Agents:
         
         agent_config = self.config.get(agent_name,{})
         if not agent_config:
-            raise ValueError(f"Agent '{self.agent_name}' configuration is not found in agent_config.yaml .")
+            raise ValueError(f"Agent '{agent_name}' configuration is not found in agent_config.yaml .")
         
         role = agent_config.get("role")
         goal = agent_config.get("goal")
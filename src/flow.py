@@ -82,6 +82,28 @@ class DataAnalysisFlow(Flow[DataState]):
             dataset_path=self.state.dataset_path
             )
 
+    def report_prefix_reuse(self, prefix_stats: dict, crew_output) -> None:
+        """
+        Print prompt reuse for the last run when crew_verbose is on.
+
+        prefix_stats only covers the task description (not the system prompt or the
+        expected output CrewAI appends), so the token usage reported by CrewAI is
+        printed next to it; cached prompt tokens are shown if the installed version reports them.
+        """
+        if not self.crew_verbose:
+            return
+        print(f"♻️  Description prefix reuse ({prefix_stats['key']}): "
+              f"{prefix_stats['shared_prefix_chars']}/{prefix_stats['prompt_chars']} chars "
+              f"({prefix_stats['shared_ratio']:.0%})")
+        
+        usage = getattr(crew_output, "token_usage", None)
+        if usage is None:
+            return
+        cached = getattr(usage, "cached_prompt_tokens", None)
+        print(f"🪙 Token usage: prompt={usage.prompt_tokens}, "
+              f"cached_prompt={cached if cached is not None else 'n/a'}, "
+              f"completion={usage.completion_tokens}, total={usage.total_tokens}")
+
 # =========================== FLOW ===========================
 
     # --- Flow start ---
@@ -99,17 +121,22 @@ class DataAnalysisFlow(Flow[DataState]):
         
         history_str = "\n".join([f"Query: {h.query}\nResult: {h.result}" for h in self.state.history])
         
+        task = self.tasks_factory.create_task(
+            query = self.state.query,
+            history = history_str,
+            task_name="analysis_task", 
+            agent=self.ana_agent)
+        prefix_stats = self.tasks_factory.prefix_monitor.record("analysis_task", task.description)
+        
         crew = Crew(
             agents = [self.ana_agent],
-            tasks = [self.tasks_factory.create_task(
-                query = self.state.query,
-                history = history_str,
-                task_name="analysis_task", 
-                agent=self.ana_agent)],
-                verbose = self.crew_verbose
+            tasks = [task],
+            verbose = self.crew_verbose
         )
         
-        self.state.output = str(crew.kickoff())
+        crew_output = crew.kickoff()
+        self.state.output = str(crew_output)
+        self.report_prefix_reuse(prefix_stats, crew_output)
         self.state.history.append(InteractionRecord(query=self.state.query,
                                                 result = self.state.output))
         return self.state.output
@@ -122,16 +149,21 @@ class DataAnalysisFlow(Flow[DataState]):
         
         history_str = "\n".join([f"Query: {h.query}\nResult: {h.result}" for h in self.state.history])
         
+        task = self.tasks_factory.create_task(
+            query = self.state.query,
+            history = history_str,
+            task_name="visualization_task", 
+            agent=self.viz_agent)
+        prefix_stats = self.tasks_factory.prefix_monitor.record("visualization_task", task.description)
+        
         crew = Crew(
             agents = [self.viz_agent],
-            tasks = [self.tasks_factory.create_task(
-                query = self.state.query,
-                history = history_str,
-                task_name="visualization_task", 
-                agent=self.viz_agent)],
-                verbose = self.crew_verbose
+            tasks = [task],
+            verbose = self.crew_verbose
         )
-        self.state.output = str(crew.kickoff())
+        crew_output = crew.kickoff()
+        self.state.output = str(crew_output)
+        self.report_prefix_reuse(prefix_stats, crew_output)
         self.state.history.append(InteractionRecord(query=self.state.query,
                                                 result = self.state.output))
         return self.state.output
@@ -188,15 +220,20 @@ class DataAnalysisFlow(Flow[DataState]):
         # if self.state.report_generated:
         #     return self.state.output
         print("\n📝 Generating Final Report...")
+        task = self.tasks_factory.create_task(
+            query = self.state.query,
+            history = self.state.history,
+            task_name="report_task", 
+            agent=self.ana_agent)
+        prefix_stats = self.tasks_factory.prefix_monitor.record("report_task", task.description)
+        
         crew = Crew(
             agents = [self.ana_agent],
-            tasks = [self.tasks_factory.create_task(
-                query = self.state.query,
-                history = self.state.history,
-                task_name="report_task", 
-                agent=self.ana_agent)]
+            tasks = [task]
         )
-        self.state.output = str(crew.kickoff())
+        crew_output = crew.kickoff()
+        self.state.output = str(crew_output)
+        self.report_prefix_reuse(prefix_stats, crew_output)
         print(f"\n✅ Report Generated Successfully at {self.state.result_path}")
         return self.state.output
     
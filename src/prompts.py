@@ -0,0 +1,74 @@
+""" Compile prompt templates once per dataset and measure prompt prefix reuse """
+
+import copy
+import os
+import yaml
+from functools import lru_cache
+from typing import Dict, Tuple
+
+
+@lru_cache(maxsize=32)
+def _compile(config_path: str,
+             mtime: float,
+             substitutions: Tuple[Tuple[str, str], ...]) -> Dict:
+    """Read a YAML config once per modification time and fill in its per-dataset placeholders"""
+    with open(config_path, 'r', encoding='utf-8') as file:
+        content = file.read()
+    for key, value in substitutions:
+        content = content.replace("{" + key + "}", str(value))
+    return yaml.safe_load(content)
+
+
+def compile_config(config_path: str, **substitutions: str) -> Dict:
+    """
+    Return the prompt config with static placeholders (dataset name, paths) filled in.
+
+    The parsed template is cached on (config_path, file mtime, substitutions), so every
+    flow on the same dataset skips re-reading the YAML, while edits to the file are
+    picked up on the next call. Each caller gets its own deep copy of the cached config.
+    Placeholders not passed here (e.g. {user_query}, {context}) are left for `.format()`.
+
+    Raises FileNotFoundError if config_path does not exist.
+    """
+    config_path = os.path.abspath(config_path)
+    mtime = os.path.getmtime(config_path)
+    return copy.deepcopy(_compile(config_path, mtime, tuple(sorted(substitutions.items()))))
+
+
+def shared_prefix_length(previous: str, current: str) -> int:
+    """Number of leading characters two prompts have in common"""
+    length = 0
+    for a, b in zip(previous, current):
+        if a != b:
+            break
+        length += 1
+    return length
+
+
+class PrefixCacheMonitor:
+    """
+    Track how much of each prompt repeats the previous prompt of the same task.
+
+    Provider-side prompt caching (and local KV/prefix caches) only hit on an exact
+    shared prefix, so `shared_ratio` is a proxy for cached tokens on later turns.
+    It only sees the text passed to `record` (e.g. the task description), not the
+    system prompt or anything the framework appends after it.
+    """
+
+    def __init__(self) -> None:
+        self.last_prompts: Dict[str, str] = {}
+        self.history: list = []
+
+    def record(self, key: str, prompt: str) -> Dict:
+        """Compare the prompt with the last one under `key` and store the stats"""
+        previous = self.last_prompts.get(key, "")
+        shared = shared_prefix_length(previous, prompt)
+        stats = {
+            "key": key,
+            "prompt_chars": len(prompt),
+            "shared_prefix_chars": shared,
+            "shared_ratio": shared / len(prompt) if prompt else 0.0,
+        }
+        self.last_prompts[key] = prompt
+        self.history.append(stats)
+        return stats
@@ -1,11 +1,11 @@
 """ Custom tasks based on Task from crewai """
 
 import os
-import yaml
 
 from crewai import Task
 
 from src.agents import Agents
+from src.prompts import compile_config, PrefixCacheMonitor
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 root_path = os.path.dirname(current_dir)
@@ -23,16 +23,15 @@ class TaskFactory:
         self.dataset_path = dataset_path
         self.result_path = result_path
         
+        # Compiled once per dataset; only {user_query} and {context} remain to fill
         try:
-            with open(config_path, 'r', encoding='utf-8') as file:
-                content = file.read()
-            self.config = yaml.safe_load(
-                content.replace("{result_path}", result_path) \
-                    .replace("{dataset_name}", self.dataset_cleanname)\
-                    .replace("{dataset_path}", dataset_path)
-                    )
+            self.config = compile_config(config_path,
+                                         result_path=result_path,
+                                         dataset_name=self.dataset_cleanname,
+                                         dataset_path=dataset_path)
         except FileNotFoundError as e:
-            raise FileNotFoundError(f"Task configuration file not found: {self.config_path}") from e
+            raise FileNotFoundError(f"Task configuration file not found: {config_path}") from e
+        self.prefix_monitor = PrefixCacheMonitor()
         
     def create_task(self,
                     agent: Agents,
@@ -43,9 +42,9 @@ class TaskFactory:
         
         task_config = self.config.get(task_name,{})
         if not task_config:
-            raise ValueError(f"Task '{self.task_name}' configuration is not found in task_config.yaml .")
+            raise ValueError(f"Task '{task_name}' configuration is not found in task_config.yaml .")
+        # Static instructions lead, volatile query/history trail (see task_config.yaml)
         description = task_config.get("description", "").format(
-            dataset_path = self.dataset_path,
             user_query = query,
             context = history
         )
@@ -1,9 +1,10 @@
 """ 
-    3 Test cases to test the functionalities and correctness of the Agent
+    4 Test cases to test the functionalities and correctness of the Agent
 
       -  Test 1: Test the Database access permissions
       -  Test 2: Test the custom tool PythonREPLTool's functionalities
       -  Test 3: Test if the agents can return a correct answer
+      -  Test 4: Test if task prompts keep a stable prefix across turns
 
 """
 
@@ -13,6 +14,7 @@ import os
 from src.registry import USER_PERMISSIONS
 from src.tools import PythonREPLTool
 from src.flow import DataAnalysisFlow
+from src.prompts import compile_config, PrefixCacheMonitor
 
 api_key = os.getenv("OPENAI_API_KEY")
 api_org = os.getenv("OPENAI_ORG")
@@ -85,6 +87,30 @@ print(df['a'].sum() + df['b'].sum())
         
         print("   -> ✅Pass [Test 3]: Flow completed automatically using mock inputs.")
         
+    def testPromptPrefixReuse(self):
+        """Test if the volatile query/history stay after the static task instructions"""
+        
+        print("\n 🩺[Test 4] Testing Prompt Prefix Reuse...")
+        
+        config_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src", "task_config.yaml")
+        config = compile_config(config_path, result_path="results", dataset_name="chinook", dataset_path="datas/chinook.db")
+        self.assertEqual(config, compile_config(config_path, result_path="results", dataset_name="chinook", dataset_path="datas/chinook.db"),
+                         "Compiled template should be reused per dataset")
+        config["analysis_task"]["description"] = "mutated"
+        self.assertNotEqual(compile_config(config_path, result_path="results", dataset_name="chinook", dataset_path="datas/chinook.db")["analysis_task"]["description"],
+                            "mutated", "Callers must not share the cached config")
+        config = compile_config(config_path, result_path="results", dataset_name="chinook", dataset_path="datas/chinook.db")
+        
+        template = config["analysis_task"]["description"]
+        monitor = PrefixCacheMonitor()
+        monitor.record("analysis_task", template.format(user_query="How many tables?", context=""))
+        stats = monitor.record("analysis_task", template.format(user_query="Top customer?", context="Query: How many tables?\nResult: 11"))
+        
+        self.assertEqual(stats["shared_prefix_chars"], template.index("{context}"))
+        self.assertGreater(stats["shared_ratio"], 0.8, f"Prompt prefix reuse too low: {stats}")
+        
+        print("   -> ✅Pass [Test 4]: Task prompts share a stable prefix across turns.")
+        
 if __name__ == '__main__':
     unittest.main()   
         